@@ -4,50 +4,83 @@ Fantasy Football Projections Web App
 Flask application for viewing Vegas-based projections
 """
 
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, request
 from src.api.odds_api import OddsAPIClient, parse_player_props, detect_position
 from src.api.sleeper_api import SleeperAPIClient
 from src.projections.calculator import ProjectionCalculator
 from src.optimizer.start_sit import StartSitOptimizer
 from config.scoring_formats import get_available_formats
-from datetime import datetime
-import traceback
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+import atexit
+import gzip
+import hashlib
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+import time
+
+import orjson
 
 app = Flask(__name__)
-sleeper_client = SleeperAPIClient()
-optimizer = StartSitOptimizer()
 
+# Errors are queued from request threads and written to stderr by a
+# background listener, so handlers never block on the stderr lock
+logger = logging.getLogger(__name__)
+logger.propagate = False
+_log_queue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
-def calculate_nfl_week(commence_time_str: str) -> str:
-    """Calculate NFL week from game start time.
+PROJECTIONS_CACHE_FILE = 'data/projections_cache.json'
 
-    Args:
-        commence_time_str: ISO format timestamp
+# Serialized /api/projections body, rebuilt only when the cache file changes.
+# The whole dict is swapped on refresh so readers always see a consistent entry.
+_projections_response = {'mtime': None, 'body': None, 'gzip_body': None, 'etag': None}
+_projections_lock = threading.Lock()
 
-    Returns:
-        Week string (e.g., "Week 10")
-    """
-    if not commence_time_str:
-        return "TBD"
+# Sleeper asks clients to fetch the full players list at most once a day
+SLEEPER_PLAYERS_TTL = 24 * 60 * 60
 
-    try:
-        game_time = datetime.fromisoformat(commence_time_str.replace('Z', '+00:00'))
+# Shared read-only Sleeper players database, swapped whole on refresh
+_sleeper_players = {'fetched_at': 0.0, 'players': None}
+_sleeper_players_lock = threading.Lock()
+
+# Stand-in for roster player IDs missing from the players database
+_UNKNOWN_PLAYER = MappingProxyType({})
+
+# Runs independent Sleeper calls for a single request concurrently
+_sleeper_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='sleeper')
+
+# /api/formats is fully determined by SCORING_FORMATS, so it is encoded once
+_FORMATS_BODY = orjson.dumps({
+    'success': True,
+    'formats': get_available_formats()
+})
+_FORMATS_ETAG = hashlib.blake2b(_FORMATS_BODY, digest_size=16).hexdigest()
+
+# Browsers may store API responses but must revalidate them with the ETag on
+# every request, so a poll after a cache refresh sees the new data at once
+API_CACHE_CONTROL = 'public, no-cache'
 
-        # NFL season typically starts first Thursday after Labor Day (early September)
-        # This is a simplified calculation
-        year = game_time.year
 
-        # Approximate season start (adjust this for actual season)
-        # For 2024-2025 season, Week 1 starts around September 5, 2024
-        season_start = datetime(2024, 9, 5, tzinfo=game_time.tzinfo) if year == 2024 else datetime(year, 9, 7, tzinfo=game_time.tzinfo)
+@cache
+def get_sleeper_client() -> SleeperAPIClient:
+    """Get the shared Sleeper client, created on first use."""
+    return SleeperAPIClient()
 
-        # Calculate week number
-        days_since_start = (game_time - season_start).days
-        week_num = max(1, min(18, (days_since_start // 7) + 1))
 
-        return f"Week {week_num}"
-    except Exception:
-        return "TBD"
+@cache
+def get_optimizer() -> StartSitOptimizer:
+    """Get the shared lineup optimizer, created on first use."""
+    return StartSitOptimizer()
 
 
 @app.route('/')
@@ -62,6 +95,80 @@ def optimizer_page():
     return render_template('optimizer.html')
 
 
+def _json_response(payload: Any, status: int = 200) -> Response:
+    """Serialize a payload into a JSON response.
+
+    Args:
+        payload: JSON-serializable object
+        status: HTTP status code
+
+    Returns:
+        Flask response with an application/json body
+    """
+    return Response(orjson.dumps(payload), status=status, mimetype='application/json')
+
+
+def _conditional_response(response: Response, etag: Optional[str] = None) -> Response:
+    """Attach caching headers and honor If-None-Match / If-Modified-Since.
+
+    Args:
+        response: Response to make conditional
+        etag: Precomputed ETag. If not provided, one is hashed from the body.
+
+    Returns:
+        The response, or a 304 Not Modified if the client's copy is current
+    """
+    if etag is None:
+        response.add_etag()
+    else:
+        response.set_etag(etag)
+    response.headers['Cache-Control'] = API_CACHE_CONTROL
+    return response.make_conditional(request)
+
+
+def _load_projections_response(cache_file: str) -> Dict[str, Any]:
+    """Get the serialized projections response for the cache file.
+
+    The file is only parsed and re-encoded when its mtime changes, so
+    repeated requests return the same bytes without touching JSON. A gzipped
+    copy of the body is built at the same time for clients that accept it.
+
+    Args:
+        cache_file: Path to the projections cache file
+
+    Returns:
+        Dict with the JSON response body, its gzipped variant and its ETag
+    """
+    global _projections_response
+
+    mtime = os.stat(cache_file).st_mtime_ns
+    cached = _projections_response
+    if cached['mtime'] == mtime:
+        return cached
+
+    with _projections_lock:
+        if _projections_response['mtime'] != mtime:
+            with open(cache_file, 'rb') as f:
+                cache_data = orjson.loads(f.read())
+
+            body = orjson.dumps({
+                'success': True,
+                'projections': cache_data['projections'],
+                'total_players': cache_data['total_players'],
+                'formats': cache_data['formats'],
+                'last_updated': cache_data.get('last_updated_display', 'Unknown')
+            })
+
+            _projections_response = {
+                'mtime': mtime,
+                'body': body,
+                'gzip_body': gzip.compress(body, compresslevel=6, mtime=0),
+                'etag': hashlib.blake2b(body, digest_size=16).hexdigest()
+            }
+
+        return _projections_response
+
+
 @app.route('/api/projections', methods=['GET'])
 def get_projections():
     """API endpoint to fetch projections from cache.
@@ -70,80 +177,119 @@ def get_projections():
     Run update_projections.py to refresh the cache.
     """
     try:
-        import json
-        import os
-
         # Read from cache file
-        cache_file = 'data/projections_cache.json'
+        cache_file = PROJECTIONS_CACHE_FILE
 
         if not os.path.exists(cache_file):
-            return jsonify({
+            return _json_response({
                 'success': False,
                 'error': 'No cached data found. Please run: python update_projections.py'
-            }), 404
+            }, 404)
 
-        with open(cache_file, 'r') as f:
-            cache_data = json.load(f)
+        cached = _load_projections_response(cache_file)
 
-        return jsonify({
-            'success': True,
-            'projections': cache_data['projections'],
-            'total_players': cache_data['total_players'],
-            'formats': cache_data['formats'],
-            'last_updated': cache_data.get('last_updated_display', 'Unknown')
-        })
+        # Each encoding is a distinct representation, so it gets its own ETag
+        if request.accept_encodings['gzip']:
+            response = Response(cached['gzip_body'], mimetype='application/json')
+            response.headers['Content-Encoding'] = 'gzip'
+            etag = f"{cached['etag']}-gzip"
+        else:
+            response = Response(cached['body'], mimetype='application/json')
+            etag = cached['etag']
+        response.vary.add('Accept-Encoding')
+        response.last_modified = cached['mtime'] // 1_000_000_000
+
+        return _conditional_response(response, etag)
 
     except Exception as e:
-        print(f"Error reading cache: {e}")
-        traceback.print_exc()
-        return jsonify({
+        logger.exception("Error reading cache: %s", e)
+        return _json_response({
             'success': False,
             'error': f'Error loading cached data: {str(e)}'
-        }), 500
+        }, 500)
 
 
 @app.route('/api/formats', methods=['GET'])
 def get_formats():
     """Get available scoring formats."""
-    return jsonify({
+    response = Response(_FORMATS_BODY, mimetype='application/json')
+    return _conditional_response(response, _FORMATS_ETAG)
+
+
+@cache
+def _markets_response() -> Tuple[bytes, str]:
+    """Encode the prop markets response once per process.
+
+    Returns:
+        Tuple of (JSON response body, ETag)
+    """
+    client = OddsAPIClient()
+    body = orjson.dumps({
         'success': True,
-        'formats': get_available_formats()
+        'markets': client.get_available_markets()
     })
+    return body, hashlib.blake2b(body, digest_size=16).hexdigest()
 
 
 @app.route('/api/markets', methods=['GET'])
 def get_markets():
     """Get available prop markets."""
-    client = OddsAPIClient()
-    markets = client.get_available_markets()
-    return jsonify({
-        'success': True,
-        'markets': markets
-    })
+    body, etag = _markets_response()
+    response = Response(body, mimetype='application/json')
+    return _conditional_response(response, etag)
 
 
 # Sleeper Integration Routes
 
+def _all_players() -> Mapping[str, Any]:
+    """Get the Sleeper players database, refetched at most once per TTL.
+
+    Returns:
+        Read-only mapping of player_id to player data
+    """
+    global _sleeper_players
+
+    cached = _sleeper_players
+    if cached['players'] is not None and time.monotonic() - cached['fetched_at'] < SLEEPER_PLAYERS_TTL:
+        return cached['players']
+
+    with _sleeper_players_lock:
+        cached = _sleeper_players
+        if cached['players'] is not None and time.monotonic() - cached['fetched_at'] < SLEEPER_PLAYERS_TTL:
+            return cached['players']
+
+        players = get_sleeper_client().get_all_players()
+        if not players:
+            # Don't cache a failed fetch; fall back to the last good copy if any
+            return cached['players'] or MappingProxyType({})
+
+        _sleeper_players = {
+            'fetched_at': time.monotonic(),
+            'players': MappingProxyType(players)
+        }
+        return _sleeper_players['players']
+
+
 @app.route('/api/sleeper/user/<username>', methods=['GET'])
 def get_sleeper_user(username):
     """Get Sleeper user by username."""
     try:
-        user = sleeper_client.get_user(username)
+        user = get_sleeper_client().get_user(username)
         if not user:
-            return jsonify({
+            return _json_response({
                 'success': False,
                 'error': 'User not found'
-            }), 404
+            }, 404)
 
-        return jsonify({
+        return _json_response({
             'success': True,
             'user': user
         })
     except Exception as e:
-        return jsonify({
+        return _json_response({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 
 @app.route('/api/sleeper/user/<user_id>/leagues', methods=['GET'])
@@ -151,60 +297,64 @@ def get_sleeper_leagues(user_id):
     """Get user's leagues."""
     try:
         season = request.args.get('season', '2024')
-        leagues = sleeper_client.get_user_leagues(user_id, season)
+        leagues = get_sleeper_client().get_user_leagues(user_id, season)
 
-        return jsonify({
+        return _json_response({
             'success': True,
             'leagues': leagues,
             'count': len(leagues)
         })
     except Exception as e:
-        return jsonify({
+        return _json_response({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 
 @app.route('/api/sleeper/league/<league_id>', methods=['GET'])
 def get_sleeper_league(league_id):
     """Get league details."""
     try:
-        league = sleeper_client.get_league(league_id)
+        league = get_sleeper_client().get_league(league_id)
         if not league:
-            return jsonify({
+            return _json_response({
                 'success': False,
                 'error': 'League not found'
-            }), 404
+            }, 404)
 
-        return jsonify({
+        return _json_response({
             'success': True,
             'league': league
         })
     except Exception as e:
-        return jsonify({
+        return _json_response({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 
 @app.route('/api/sleeper/league/<league_id>/roster/<user_id>', methods=['GET'])
 def get_sleeper_roster(league_id, user_id):
     """Get user's roster in a league."""
     try:
-        roster = sleeper_client.get_user_roster(league_id, user_id)
+        # Fetch roster and player data concurrently
+        roster_future = _sleeper_pool.submit(get_sleeper_client().get_user_roster, league_id, user_id)
+        players_future = _sleeper_pool.submit(_all_players)
+
+        roster = roster_future.result()
         if not roster:
-            return jsonify({
+            return _json_response({
                 'success': False,
                 'error': 'Roster not found'
-            }), 404
+            }, 404)
 
-        # Get player data
-        players_db = sleeper_client.get_all_players()
+        players_db = players_future.result()
 
         # Enrich roster with player names
+        get_player = players_db.get
         enriched_players = []
-        for player_id in roster.get('players', []):
-            player_data = players_db.get(player_id, {})
+        for player_id in roster.get('players', ()):
+            player_data = get_player(player_id, _UNKNOWN_PLAYER)
             enriched_players.append({
                 'player_id': player_id,
                 'name': player_data.get('full_name', 'Unknown'),
@@ -213,7 +363,7 @@ def get_sleeper_roster(league_id, user_id):
                 'injury_status': player_data.get('injury_status', '')
             })
 
-        return jsonify({
+        return _json_response({
             'success': True,
             'roster': {
                 **roster,
@@ -221,69 +371,89 @@ def get_sleeper_roster(league_id, user_id):
             }
         })
     except Exception as e:
-        return jsonify({
+        return _json_response({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 
 @app.route('/api/sleeper/optimize', methods=['POST'])
 def optimize_lineup():
     """Optimize lineup for maximum projected points."""
     try:
-        data = request.get_json()
+        # Reject malformed payloads before any Sleeper requests are made
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            return _json_response({
+                'success': False,
+                'error': 'Request body must be a JSON object'
+            }, 400)
+
         league_id = data.get('league_id')
         user_id = data.get('user_id')
         scoring_format = data.get('scoring_format', 'PPR')
 
         if not league_id or not user_id:
-            return jsonify({
+            return _json_response({
                 'success': False,
                 'error': 'league_id and user_id are required'
-            }), 400
+            }, 400)
+
+        if not isinstance(league_id, str) or not isinstance(user_id, str):
+            return _json_response({
+                'success': False,
+                'error': 'league_id and user_id must be strings'
+            }, 400)
+
+        if scoring_format not in get_available_formats():
+            return _json_response({
+                'success': False,
+                'error': f'Unknown scoring format: {scoring_format}'
+            }, 400)
+
+        # Fetch roster, players database and league settings concurrently
+        roster_future = _sleeper_pool.submit(get_sleeper_client().get_user_roster, league_id, user_id)
+        players_future = _sleeper_pool.submit(_all_players)
+        league_future = _sleeper_pool.submit(get_sleeper_client().get_league, league_id)
 
-        # Get roster
-        roster = sleeper_client.get_user_roster(league_id, user_id)
+        roster = roster_future.result()
         if not roster:
-            return jsonify({
+            return _json_response({
                 'success': False,
                 'error': 'Roster not found'
-            }), 404
+            }, 404)
 
-        # Get all players database
-        players_db = sleeper_client.get_all_players()
+        players_db = players_future.result()
 
         # Get league settings for roster configuration
-        league = sleeper_client.get_league(league_id)
+        league = league_future.result()
         roster_positions = league.get('roster_positions', []) if league else None
 
         # Convert roster_positions list to dict if available
-        roster_config = None
-        if roster_positions:
-            roster_config = {}
-            for pos in roster_positions:
-                roster_config[pos] = roster_config.get(pos, 0) + 1
+        roster_config = dict(Counter(roster_positions)) if roster_positions else None
 
         # Optimize lineup
-        result = optimizer.optimize_lineup(
+        result = get_optimizer().optimize_lineup(
             roster.get('players', []),
             players_db,
             scoring_format,
             roster_config
         )
 
-        return jsonify({
+        return _json_response({
             'success': True,
             'optimization': result
         })
 
     except Exception as e:
-        traceback.print_exc()
-        return jsonify({
+        logger.exception("Error optimizing lineup: %s", e)
+        return _json_response({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Development server only; use gunicorn (see gunicorn.conf.py) in production.
+    # Flask enables debug mode itself when FLASK_DEBUG is set.
+    app.run(host='0.0.0.0', port=5000)
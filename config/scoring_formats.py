@@ -2,7 +2,18 @@
 Fantasy Football Scoring Format Definitions
 """
 
-SCORING_FORMATS = {
+from types import MappingProxyType
+
+
+def _freeze(rules):
+    """Recursively wrap nested scoring dicts in read-only views."""
+    return MappingProxyType({
+        key: _freeze(value) if isinstance(value, dict) else value
+        for key, value in rules.items()
+    })
+
+
+SCORING_FORMATS = _freeze({
     "PPR": {
         "name": "Points Per Reception",
         "passing": {
@@ -72,7 +83,10 @@ SCORING_FORMATS = {
             "lost": -2,
         },
     },
-}
+})
+
+# Formats never change at runtime, so the list is built once
+_AVAILABLE_FORMATS = tuple(SCORING_FORMATS.keys())
 
 
 def get_scoring_format(format_name):
@@ -81,5 +95,5 @@ def get_scoring_format(format_name):
 
 
 def get_available_formats():
-    """Get list of available scoring formats."""
-    return list(SCORING_FORMATS.keys())
+    """Get tuple of available scoring formats."""
+    return _AVAILABLE_FORMATS
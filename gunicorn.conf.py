@@ -0,0 +1,23 @@
+"""
+Gunicorn configuration for serving the projections web app
+Run with: gunicorn app:app
+"""
+
+import multiprocessing
+import os
+
+bind = "0.0.0.0:5000"
+
+# Every worker holds its own Sleeper players DB, projections body and
+# optimizer index, so keep the process count small and let threads
+# overlap the I/O-bound Sleeper requests
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "gthread"
+threads = 8
+
+# Must stay off: app.py starts its log listener thread and Sleeper
+# executor at import, and neither survives the fork into workers
+preload_app = False
+
+# Keep client connections open between polling requests
+keepalive = 15
@@ -5,13 +5,17 @@ Main entry point for generating projections from Vegas props
 """
 
 import argparse
-import json
 import sys
+import traceback
+from itertools import chain
+from operator import itemgetter
 from typing import List
+
+import orjson
 from tabulate import tabulate
 
 from src.api.odds_api import OddsAPIClient, parse_player_props
-from src.projections.calculator import ProjectionCalculator
+from src.projections.calculator import get_calculator
 from config.scoring_formats import get_available_formats
 
 
@@ -27,24 +31,20 @@ def format_projections_table(projections: List[dict]) -> str:
     if not projections:
         return "No projections available."
 
-    # Group by player
+    # Group by player and collect formats in a single pass
     players = {}
+    format_names = set()
     for proj in projections:
-        player = proj["player"]
-        if player not in players:
-            players[player] = {}
-        players[player][proj["format"]] = proj["total_points"]
+        players.setdefault(proj["player"], {})[proj["format"]] = proj["total_points"]
+        format_names.add(proj["format"])
 
     # Create table
-    headers = ["Player"] + sorted(set(proj["format"] for proj in projections))
-    rows = []
-
-    for player, formats in sorted(players.items()):
-        row = [player]
-        for format_name in headers[1:]:
-            points = formats.get(format_name, 0.0)
-            row.append(f"{points:.2f}")
-        rows.append(row)
+    format_names = sorted(format_names)
+    headers = ["Player"] + format_names
+    rows = [
+        [player] + [f"{formats.get(format_name, 0.0):.2f}" for format_name in format_names]
+        for player, formats in sorted(players.items())
+    ]
 
     return tabulate(rows, headers=headers, tablefmt="grid")
 
@@ -81,6 +81,28 @@ def format_detailed_projection(projection: dict) -> str:
     return "\n".join(output)
 
 
+def write_projections_json(projections: List[dict], output_path: str) -> None:
+    """Write projections to a JSON file, serializing one record at a time.
+
+    Args:
+        projections: List of projection dictionaries
+        output_path: Output file path
+    """
+    if not projections:
+        with open(output_path, "wb") as f:
+            f.write(b"[]")
+        return
+
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        f.write(b"[")
+        for i, projection in enumerate(projections):
+            f.write(b",\n  " if i else b"\n  ")
+            # Nest each record one level in, as a whole-list dump would;
+            # JSON strings never contain raw newlines
+            f.write(orjson.dumps(projection, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n  "))
+        f.write(b"\n]")
+
+
 def main():
     """Main CLI function."""
     parser = argparse.ArgumentParser(
@@ -149,17 +171,16 @@ Examples:
     try:
         # Initialize API client
         print("Initializing API client...")
-        client = OddsAPIClient(api_key=args.api_key)
-
-        # Fetch player props
-        print(f"Fetching player props for {args.sport}...")
-        if args.markets:
-            print(f"Markets: {', '.join(args.markets)}")
+        with OddsAPIClient(api_key=args.api_key) as client:
+            # Fetch player props
+            print(f"Fetching player props for {args.sport}...")
+            if args.markets:
+                print(f"Markets: {', '.join(args.markets)}")
 
-        events = client.get_player_props(
-            sport=args.sport,
-            markets=args.markets
-        )
+            events = client.get_player_props(
+                sport=args.sport,
+                markets=args.markets
+            )
 
         if not events:
             print("No events found. The season may not have started or there are no available props.")
@@ -167,11 +188,8 @@ Examples:
 
         print(f"Found {len(events)} events with player props.")
 
-        # Parse player props from all events
-        all_players = {}
-        for event in events:
-            players = parse_player_props(event)
-            all_players.update(players)
+        # Parse player props from all events (later events win for duplicate names)
+        all_players = dict(chain.from_iterable(parse_player_props(event).items() for event in events))
 
         if not all_players:
             print("No player props found in the events.")
@@ -184,21 +202,20 @@ Examples:
         all_projections = []
 
         formats = [args.format] if args.format else get_available_formats()
+        calculators = {format_name: get_calculator(format_name) for format_name in formats}
 
         for player_name, player_data in all_players.items():
             for format_name in formats:
-                calculator = ProjectionCalculator(format_name)
-                projection = calculator.calculate_projection(player_data)
+                projection = calculators[format_name].calculate_projection(player_data)
                 all_projections.append(projection)
 
         # Sort by total points (descending) for first format
-        all_projections.sort(key=lambda x: x["total_points"], reverse=True)
+        all_projections.sort(key=itemgetter("total_points"), reverse=True)
 
         # Output results
         if args.output:
             # Export to JSON
-            with open(args.output, "w") as f:
-                json.dump(all_projections, f, indent=2)
+            write_projections_json(all_projections, args.output)
             print(f"\nProjections exported to {args.output}")
         else:
             # Display in terminal
@@ -215,7 +232,6 @@ Examples:
         sys.exit(1)
     except Exception as e:
         print(f"Unexpected error: {e}", file=sys.stderr)
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
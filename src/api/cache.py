@@ -0,0 +1,6 @@
+"""Local cache location shared by the API clients."""
+
+import os
+
+# Sleeper players database and Odds API responses are cached under this directory
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "jarn-ff")
@@ -2,30 +2,110 @@
 Client for The Odds API to fetch player props
 """
 
+import gzip
+import hashlib
 import os
+import re
+import sqlite3
+import time
+import orjson
 import requests
-from typing import Dict, List, Optional
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Optional, Tuple
 from dotenv import load_dotenv
+from urllib3.util.retry import Retry
+
+from .cache import CACHE_DIR
 
 # Load environment variables
 load_dotenv()
 
+# Name fragments of known tight ends, used to tell TEs from WRs
+TE_KEYWORDS = (
+    'kelce', 'kittle', 'andrews', 'pitts', 'goedert', 'hockenson',
+    'schultz', 'ertz', 'engram', 'kmet', 'kincaid', 'laporta',
+    'njoku', 'freiermuth', 'henry', 'gesicki', 'tonyan', 'bates',
+    'likely', 'gray', 'everett', 'conklin', 'hooper', 'uzomah',
+    'thomas', 'dulcich', 'bellinger', 'otton', 'kraft', 'ferguson'
+)
+
+# Prop category bits used to classify players in detect_position
+_HAS_PASS = 1
+_HAS_RUSH = 2
+_HAS_REC = 4
+_PROP_CATEGORY_BITS = {
+    "player_pass_yds": _HAS_PASS,
+    "player_pass_tds": _HAS_PASS,
+    "player_rush_yds": _HAS_RUSH,
+    "player_rush_attempts": _HAS_RUSH,
+    "player_receptions": _HAS_REC,
+    "player_reception_yds": _HAS_REC,
+}
+
+# Single-pass substring match against all TE keywords
+_TE_KEYWORD_PATTERN = re.compile("|".join(map(re.escape, TE_KEYWORDS)))
+
 
 class OddsAPIClient:
     """Client for interacting with The Odds API."""
 
     BASE_URL = "https://api.the-odds-api.com/v4"
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Maximum number of per-event odds requests in flight at once
+    MAX_CONCURRENT_REQUESTS = 10
+
+    # (connect, read) timeouts in seconds
+    TIMEOUT = (3, 10)
+
+    # Stored responses older than this are dropped. Per-event odds are keyed by
+    # event id, so entries for past games would otherwise pile up all season.
+    ETAG_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+
+    def __init__(self, api_key: Optional[str] = None, cache_dir: Optional[str] = None):
         """Initialize the API client.
 
         Args:
             api_key: The Odds API key. If not provided, will look for ODDS_API_KEY env var.
+            cache_dir: Directory for the ETag response cache (default: ~/.cache/jarn-ff)
         """
         self.api_key = api_key or os.getenv("ODDS_API_KEY")
         if not self.api_key:
             raise ValueError("API key is required. Set ODDS_API_KEY environment variable or pass api_key parameter.")
 
+        # Responses are stored with their ETag so unchanged data can be revalidated
+        self.etag_db = self._init_etag_db(os.path.join(cache_dir or CACHE_DIR, "etags.db"))
+
+        # Parsed responses already fetched by this client, keyed like the ETag cache
+        self._responses = {}
+
+        # Reuse keep-alive connections across the events + per-event requests
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self):
+        """Close the underlying HTTP session and release pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def _make_request(self, endpoint: str, params: Dict = None) -> Dict:
         """Make a request to The Odds API.
 
@@ -34,14 +114,24 @@ class OddsAPIClient:
             params: Query parameters
 
         Returns:
-            JSON response as dictionary
+            JSON response as dictionary. Repeated requests with the same
+            parameters return the response already fetched by this client.
         """
         url = f"{self.BASE_URL}/{endpoint}"
         params = params or {}
+
+        # Key the cache on everything except the API key
+        cache_key = hashlib.sha256(orjson.dumps([endpoint, sorted(params.items())])).hexdigest()
+        if cache_key in self._responses:
+            return self._responses[cache_key]
+
         params["apiKey"] = self.api_key
 
+        cached = self._get_cached_response(cache_key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
         try:
-            response = requests.get(url, params=params)
+            response = self.session.get(url, params=params, headers=headers, timeout=self.TIMEOUT)
             response.raise_for_status()
 
             # Check remaining requests
@@ -49,11 +139,107 @@ class OddsAPIClient:
             if remaining:
                 print(f"API Requests Remaining: {remaining}")
 
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            # Unchanged since the last fetch: reuse the stored body
+            if response.status_code == 304 and cached:
+                data = orjson.loads(gzip.decompress(cached[1]))
+                self._touch_cached_response(cache_key)
+            else:
+                data = orjson.loads(response.content)
+
+                etag = response.headers.get("ETag")
+                if etag:
+                    self._store_cached_response(cache_key, etag, response.content)
+
+            self._responses[cache_key] = data
+            return data
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             print(f"Error fetching data from The Odds API: {e}")
             raise
 
+    def _init_etag_db(self, path: str) -> Optional[str]:
+        """Create the ETag response cache schema.
+
+        Args:
+            path: Path to the sqlite database
+
+        Returns:
+            The database path, or None if the cache can't be used
+        """
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with closing(sqlite3.connect(path, timeout=5)) as conn, conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, etag TEXT NOT NULL, "
+                    "body BLOB NOT NULL, updated_at REAL NOT NULL)"
+                )
+            return path
+        except (sqlite3.Error, OSError) as e:
+            print(f"Response cache disabled: {e}")
+            return None
+
+    def _get_cached_response(self, cache_key: str) -> Optional[Tuple[str, bytes]]:
+        """Look up a stored response for a request.
+
+        Args:
+            cache_key: Hash of the endpoint and parameters
+
+        Returns:
+            Tuple of (ETag, gzipped body) or None if nothing is stored
+        """
+        if self.etag_db is None:
+            return None
+
+        try:
+            with closing(sqlite3.connect(self.etag_db, timeout=5)) as conn:
+                return conn.execute(
+                    "SELECT etag, body FROM responses WHERE key = ?", (cache_key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Ignoring unreadable response cache: {e}")
+            return None
+
+    def _store_cached_response(self, cache_key: str, etag: str, body: bytes) -> None:
+        """Store a response body with its ETag and drop expired responses.
+
+        Args:
+            cache_key: Hash of the endpoint and parameters
+            etag: ETag header returned by the API
+            body: Raw response body
+        """
+        if self.etag_db is None:
+            return
+
+        now = time.time()
+        try:
+            with closing(sqlite3.connect(self.etag_db, timeout=5)) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, etag, body, updated_at) VALUES (?, ?, ?, ?)",
+                    (cache_key, etag, gzip.compress(body), now)
+                )
+                conn.execute(
+                    "DELETE FROM responses WHERE updated_at < ?", (now - self.ETAG_CACHE_MAX_AGE,)
+                )
+        except sqlite3.Error as e:
+            # A missed write only costs a full download next time
+            print(f"Could not write response cache: {e}")
+
+    def _touch_cached_response(self, cache_key: str) -> None:
+        """Mark a stored response as used so pruning keeps it.
+
+        Args:
+            cache_key: Hash of the endpoint and parameters
+        """
+        if self.etag_db is None:
+            return
+
+        try:
+            with closing(sqlite3.connect(self.etag_db, timeout=5)) as conn, conn:
+                conn.execute(
+                    "UPDATE responses SET updated_at = ? WHERE key = ?", (time.time(), cache_key)
+                )
+        except sqlite3.Error as e:
+            print(f"Could not write response cache: {e}")
+
     def get_player_props(self, sport: str = "americanfootball_nfl",
                         regions: str = "us",
                         markets: Optional[List[str]] = None) -> List[Dict]:
@@ -80,16 +266,18 @@ class OddsAPIClient:
         endpoint = f"sports/{sport}/events"
         events = self._make_request(endpoint, params)
 
-        # Now fetch props for each event
-        all_props = []
-        for event in events:
-            event_id = event.get("id")
-            if event_id:
-                props = self.get_event_props(sport, event_id, regions, markets)
-                if props:
-                    all_props.append(props)
+        # Now fetch props for each event concurrently (results keep event order)
+        event_ids = [event.get("id") for event in events if event.get("id")]
+        if not event_ids:
+            return []
 
-        return all_props
+        with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENT_REQUESTS, len(event_ids))) as executor:
+            results = list(executor.map(
+                lambda event_id: self.get_event_props(sport, event_id, regions, markets),
+                event_ids
+            ))
+
+        return [props for props in results if props]
 
     def get_event_props(self, sport: str, event_id: str,
                        regions: str = "us",
@@ -157,10 +345,12 @@ def parse_player_props(api_response: Dict) -> Dict[str, Dict]:
     if not api_response or "bookmakers" not in api_response:
         return players
 
-    # Extract game info
-    home_team = api_response.get("home_team", "")
-    away_team = api_response.get("away_team", "")
-    commence_time = api_response.get("commence_time", "")
+    # Extract game info (shared by every player in this event)
+    game_info = {
+        "home_team": api_response.get("home_team", ""),
+        "away_team": api_response.get("away_team", ""),
+        "commence_time": api_response.get("commence_time", ""),
+    }
 
     for bookmaker in api_response.get("bookmakers", []):
         for market in bookmaker.get("markets", []):
@@ -171,39 +361,38 @@ def parse_player_props(api_response: Dict) -> Dict[str, Dict]:
                 if not player_name:
                     continue
 
-                if player_name not in players:
-                    players[player_name] = {
+                player = players.get(player_name)
+                if player is None:
+                    player = players[player_name] = {
                         "name": player_name,
-                        "props": {},
-                        "game_info": {
-                            "home_team": home_team,
-                            "away_team": away_team,
-                            "commence_time": commence_time,
-                        }
+                        # Running [sum, count] of lines per market
+                        "props": defaultdict(lambda: [0, 0]),
+                        "game_info": game_info,
                     }
 
-                # Store the line/point value for this prop
+                # Accumulate the line/point value for this prop
                 point = outcome.get("point")
                 if point and market_key:
-                    if market_key not in players[player_name]["props"]:
-                        players[player_name]["props"][market_key] = []
-
-                    players[player_name]["props"][market_key].append({
-                        "value": point,
-                        "bookmaker": bookmaker.get("title"),
-                        "price": outcome.get("price"),
-                    })
+                    totals = player["props"][market_key]
+                    totals[0] += point
+                    totals[1] += 1
 
     # Average the props from multiple bookmakers
-    for player_name, player_data in players.items():
-        for prop_key, prop_values in player_data["props"].items():
-            if prop_values:
-                avg_value = sum(p["value"] for p in prop_values) / len(prop_values)
-                player_data["props"][prop_key] = avg_value
+    for player_data in players.values():
+        player_data["props"] = {
+            prop_key: total / count
+            for prop_key, (total, count) in player_data["props"].items()
+        }
 
     return players
 
 
+@lru_cache(maxsize=4096)
+def _is_known_te_name(player_name_lower: str) -> bool:
+    """Check whether a lowercased player name contains a known TE keyword."""
+    return _TE_KEYWORD_PATTERN.search(player_name_lower) is not None
+
+
 def detect_position(player_props: Dict) -> str:
     """Detect player position based on available props.
 
@@ -215,19 +404,28 @@ def detect_position(player_props: Dict) -> str:
     """
     props = player_props.get("props", {})
 
+    # Which prop categories does this player have?
+    mask = 0
+    for prop_key in props:
+        mask |= _PROP_CATEGORY_BITS.get(prop_key, 0)
+
     # QB: Has passing yards
-    if "player_pass_yds" in props or "player_pass_tds" in props:
+    if mask & _HAS_PASS:
         return "QB"
 
+    # Rushing only: RB
+    if mask == _HAS_RUSH:
+        return "RB"
+
     # Get stats
-    has_rush = "player_rush_yds" in props or "player_rush_attempts" in props
-    has_rec = "player_receptions" in props or "player_reception_yds" in props
+    has_rush = mask & _HAS_RUSH
+    has_rec = mask & _HAS_REC
 
     rush_yds = props.get("player_rush_yds", 0)
     rec_yds = props.get("player_reception_yds", 0)
     receptions = props.get("player_receptions", 0)
 
-    # RB: Has rushing yards and either no receiving or rush-heavy
+    # RB: Has rushing and receiving props but is rush-heavy
     if has_rush and has_rec:
         # If rushing yards are higher, definitely RB
         if rush_yds > rec_yds:
@@ -236,21 +434,10 @@ def detect_position(player_props: Dict) -> str:
         elif rush_yds > 30:
             return "RB"
 
-    if has_rush and not has_rec:
-        return "RB"
-
     # For receiving-only players (WR vs TE)
     if has_rec:
         # First, check for known TEs by name (most reliable method)
-        te_keywords = [
-            'kelce', 'kittle', 'andrews', 'pitts', 'goedert', 'hockenson',
-            'schultz', 'ertz', 'engram', 'kmet', 'kincaid', 'laporta',
-            'njoku', 'freiermuth', 'henry', 'gesicki', 'tonyan', 'bates',
-            'likely', 'gray', 'everett', 'conklin', 'hooper', 'uzomah',
-            'thomas', 'dulcich', 'bellinger', 'otton', 'kraft', 'ferguson'
-        ]
-        player_name_lower = player_props.get('name', '').lower()
-        if any(keyword in player_name_lower for keyword in te_keywords):
+        if _is_known_te_name(player_props.get('name', '').lower()):
             return "TE"
 
         # Calculate yards per catch if possible
@@ -1,8 +1,17 @@
 """Sleeper API Client for league integration and roster management."""
 
+import glob
+import gzip
+import os
+import tempfile
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Any
-from datetime import datetime
+from datetime import datetime, timezone
+from urllib3.util.retry import Retry
+
+from .cache import CACHE_DIR
 
 
 class SleeperAPIClient:
@@ -10,13 +19,28 @@ class SleeperAPIClient:
 
     BASE_URL = "https://api.sleeper.app/v1"
 
-    def __init__(self):
-        """Initialize Sleeper API client."""
+    def __init__(self, cache_dir: Optional[str] = None):
+        """Initialize Sleeper API client.
+
+        Args:
+            cache_dir: Directory for the daily players cache (default: ~/.cache/jarn-ff)
+        """
+        self.cache_dir = cache_dir or CACHE_DIR
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Fantasy-Football-Projections/1.0'
         })
 
+        # Keep warm connections for concurrent route handlers and retry
+        # transient connection failures
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
     def get_user(self, username: str) -> Optional[Dict[str, Any]]:
         """Get user information by username.
 
@@ -29,8 +53,8 @@ class SleeperAPIClient:
         try:
             response = self.session.get(f"{self.BASE_URL}/user/{username}")
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return orjson.loads(response.content)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             print(f"Error fetching user: {e}")
             return None
 
@@ -48,8 +72,8 @@ class SleeperAPIClient:
         try:
             response = self.session.get(f"{self.BASE_URL}/user/{user_id}/leagues/{sport}/{season}")
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return orjson.loads(response.content)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             print(f"Error fetching leagues: {e}")
             return []
 
@@ -65,8 +89,8 @@ class SleeperAPIClient:
         try:
             response = self.session.get(f"{self.BASE_URL}/league/{league_id}")
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return orjson.loads(response.content)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             print(f"Error fetching league: {e}")
             return None
 
@@ -82,8 +106,8 @@ class SleeperAPIClient:
         try:
             response = self.session.get(f"{self.BASE_URL}/league/{league_id}/rosters")
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return orjson.loads(response.content)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             print(f"Error fetching rosters: {e}")
             return []
 
@@ -99,8 +123,8 @@ class SleeperAPIClient:
         try:
             response = self.session.get(f"{self.BASE_URL}/league/{league_id}/users")
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return orjson.loads(response.content)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             print(f"Error fetching league users: {e}")
             return []
 
@@ -117,25 +141,83 @@ class SleeperAPIClient:
         try:
             response = self.session.get(f"{self.BASE_URL}/league/{league_id}/matchups/{week}")
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return orjson.loads(response.content)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             print(f"Error fetching matchups: {e}")
             return []
 
     def get_all_players(self) -> Dict[str, Any]:
         """Get all NFL players from Sleeper.
 
+        Sleeper asks clients to fetch this at most once a day, so the response
+        (~5MB) is cached on disk under a date-stamped file name.
+
         Returns:
             Dict mapping player_id to player data
         """
+        cache_file = os.path.join(
+            self.cache_dir,
+            f"players_nfl_{datetime.now(timezone.utc):%Y%m%d}.json.gz"
+        )
+
+        players = self._read_players_cache(cache_file)
+        if players is not None:
+            return players
+
         try:
             response = self.session.get(f"{self.BASE_URL}/players/nfl")
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            players = orjson.loads(response.content)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             print(f"Error fetching players: {e}")
             return {}
 
+        self._write_players_cache(cache_file, players)
+        return players
+
+    def _read_players_cache(self, cache_file: str) -> Optional[Dict[str, Any]]:
+        """Read today's cached players database.
+
+        Args:
+            cache_file: Path to the gzipped players cache
+
+        Returns:
+            Players dict, or None if there is no usable cache
+        """
+        try:
+            with open(cache_file, "rb") as f:
+                return orjson.loads(gzip.decompress(f.read()))
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, orjson.JSONDecodeError) as e:
+            print(f"Ignoring unreadable players cache: {e}")
+            return None
+
+    def _write_players_cache(self, cache_file: str, players: Dict[str, Any]) -> None:
+        """Atomically write the players cache and remove older days' files.
+
+        Args:
+            cache_file: Path to the gzipped players cache
+            players: Players dict to cache
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(gzip.compress(orjson.dumps(players), compresslevel=1))
+                os.replace(tmp_path, cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+            for old_file in glob.glob(os.path.join(self.cache_dir, "players_nfl_*.json.gz")):
+                if old_file != cache_file:
+                    os.remove(old_file)
+        except OSError as e:
+            # Caching is best-effort (e.g. read-only filesystems)
+            print(f"Could not write players cache: {e}")
+
     def get_user_roster(self, league_id: str, user_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific user's roster in a league.
 
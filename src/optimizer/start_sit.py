@@ -1,9 +1,42 @@
 """Start/Sit Optimizer for Fantasy Football lineup decisions."""
 
 from typing import Dict, List, Any, Tuple, Optional
-import json
+import heapq
 import os
+import re
+import unicodedata
+from collections import defaultdict
 from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
+
+import orjson
+
+from src.projections.nfl_calendar import nfl_week_number
+
+# Generational suffixes and anything but letters are ignored when matching names
+_NAME_SUFFIX_PATTERN = re.compile(r'\b(?:jr|sr|ii|iii|iv)\b')
+_NON_LETTER_PATTERN = re.compile(r'[^a-z]')
+
+# Parsed projection files shared by every optimizer, keyed by (path, mtime)
+_loaded_projections: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+
+@lru_cache(maxsize=4096)
+def _canonical_name(name: str) -> str:
+    """Normalize a player name for matching.
+
+    Strips accents, case, generational suffixes and punctuation so that e.g.
+    "Marvin Harrison Jr." and "marvin harrison" compare equal.
+
+    Args:
+        name: Player name as written by Sleeper or the sportsbooks
+
+    Returns:
+        Canonical name containing only lowercase ASCII letters
+    """
+    ascii_name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii').lower()
+    return _NON_LETTER_PATTERN.sub('', _NAME_SUFFIX_PATTERN.sub('', ascii_name))
 
 
 class StartSitOptimizer:
@@ -21,7 +54,13 @@ class StartSitOptimizer:
         'BN': 6  # Bench
     }
 
-    FLEX_POSITIONS = ['RB', 'WR', 'TE']
+    FLEX_POSITIONS = frozenset({'RB', 'WR', 'TE'})
+
+    # Positions without prop-based projections
+    NON_PROJECTED_POSITIONS = frozenset({'DEF', 'K'})
+
+    # Upper bound on memoized projection lookups per optimizer
+    MAX_LOOKUP_RESULTS = 4096
 
     def __init__(self):
         """Initialize optimizer."""
@@ -29,18 +68,51 @@ class StartSitOptimizer:
         self.current_week = self._get_current_week()
         self.next_week = self._get_next_week()
         self.sleeper_players = {}
+        self._index_projections()
 
     def _load_projections(self) -> Dict[str, Any]:
-        """Load projections from cache file.
+        """Load projections from cache file, shared across optimizers.
 
         Returns:
             Dict of cached projections
         """
         cache_file = 'data/projections_cache.json'
-        if os.path.exists(cache_file):
-            with open(cache_file, 'r') as f:
-                return json.load(f)
-        return {'projections': [], 'total_players': 0}
+        try:
+            mtime = os.stat(cache_file).st_mtime_ns
+        except OSError:
+            return {'projections': [], 'total_players': 0}
+
+        # Reuse the parsed file until it is rewritten
+        key = (cache_file, mtime)
+        projections = _loaded_projections.get(key)
+        if projections is None:
+            with open(cache_file, 'rb') as f:
+                projections = orjson.loads(f.read())
+            for stale_key in [k for k in list(_loaded_projections) if k[0] == cache_file]:
+                _loaded_projections.pop(stale_key, None)
+            _loaded_projections[key] = projections
+        return projections
+
+    def _index_projections(self):
+        """Group cached projections for lookups, normalizing each name once.
+
+        Builds a (week, position, format) index of {canonical name: projection}
+        buckets for projection lookups, keeping the first projection per name in
+        file order, and a per-position index of the same shape for Sleeper
+        player mapping.
+        """
+        self._projection_index = defaultdict(dict)
+        self._projections_by_position = defaultdict(dict)
+        for proj in self.projections_cache.get('projections', []):
+            position = proj.get('position', '')
+            name = _canonical_name(proj.get('player', ''))
+            key = (proj.get('week', ''), position, proj.get('format', ''))
+            self._projection_index[key].setdefault(name, proj)
+            self._projections_by_position[position].setdefault(name, proj)
+
+        # Lookup results for this index; names are matched the same way on
+        # every request, so misses don't need to rescan the buckets
+        self._lookup_results = {}
 
     def _get_current_week(self) -> str:
         """Get current NFL week based on today's date.
@@ -48,46 +120,7 @@ class StartSitOptimizer:
         Returns:
             Current week string (e.g., "Week 7")
         """
-        now = datetime.now(timezone.utc)
-
-        # 2025 NFL Season Schedule (Thursday start dates for each week)
-        week_start_dates_2025 = [
-            datetime(2025, 9, 4, tzinfo=timezone.utc),   # Week 1
-            datetime(2025, 9, 11, tzinfo=timezone.utc),  # Week 2
-            datetime(2025, 9, 18, tzinfo=timezone.utc),  # Week 3
-            datetime(2025, 9, 25, tzinfo=timezone.utc),  # Week 4
-            datetime(2025, 10, 2, tzinfo=timezone.utc),  # Week 5
-            datetime(2025, 10, 9, tzinfo=timezone.utc),  # Week 6
-            datetime(2025, 10, 16, tzinfo=timezone.utc), # Week 7
-            datetime(2025, 10, 23, tzinfo=timezone.utc), # Week 8
-            datetime(2025, 10, 30, tzinfo=timezone.utc), # Week 9
-            datetime(2025, 11, 6, tzinfo=timezone.utc),  # Week 10
-            datetime(2025, 11, 13, tzinfo=timezone.utc), # Week 11
-            datetime(2025, 11, 20, tzinfo=timezone.utc), # Week 12
-            datetime(2025, 11, 27, tzinfo=timezone.utc), # Week 13
-            datetime(2025, 12, 4, tzinfo=timezone.utc),  # Week 14
-            datetime(2025, 12, 11, tzinfo=timezone.utc), # Week 15
-            datetime(2025, 12, 18, tzinfo=timezone.utc), # Week 16
-            datetime(2025, 12, 25, tzinfo=timezone.utc), # Week 17
-            datetime(2026, 1, 1, tzinfo=timezone.utc),   # Week 18
-        ]
-
-        # Find which week we're currently in
-        for i, week_start in enumerate(week_start_dates_2025):
-            if i < len(week_start_dates_2025) - 1:
-                next_week_start = week_start_dates_2025[i + 1]
-                if week_start <= now < next_week_start:
-                    return f"Week {i + 1}"
-            else:
-                # Last week (Week 18)
-                if now >= week_start:
-                    return f"Week {i + 1}"
-
-        # If before Week 1, return Week 1
-        if now < week_start_dates_2025[0]:
-            return "Week 1"
-
-        return "Week 1"
+        return f"Week {nfl_week_number(datetime.now(timezone.utc))}"
 
     def _get_next_week(self) -> str:
         """Get next NFL week based on current week.
@@ -109,24 +142,24 @@ class StartSitOptimizer:
         Returns:
             Projection data or None if not found
         """
-        full_name = sleeper_player.get('full_name', '').lower()
+        full_name = _canonical_name(sleeper_player.get('full_name', ''))
         position = sleeper_player.get('position', '')
 
-        # Try to find matching projection
-        for proj in self.projections_cache.get('projections', []):
-            proj_name = proj.get('player_name', '').lower()
-            proj_position = proj.get('position', '')
+        position_projections = self._projections_by_position.get(position)
+        if not position_projections:
+            return None
 
-            # Exact match
-            if proj_name == full_name and proj_position == position:
-                return proj
+        # Exact match
+        proj = position_projections.get(full_name)
+        if proj is not None:
+            return proj
 
-            # Partial match (handles name variations)
-            if full_name in proj_name or proj_name in full_name:
-                if proj_position == position:
-                    return proj
-
-        return None
+        # Partial match (handles name variations)
+        return next(
+            (p for proj_name, p in position_projections.items()
+             if full_name in proj_name or proj_name in full_name),
+            None
+        )
 
     def get_player_projection(self, player_name: str, position: str, scoring_format: str = 'PPR') -> tuple[float, bool, str]:
         """Get projected points for a player for the upcoming week.
@@ -142,31 +175,48 @@ class StartSitOptimizer:
             - has_projection is False if player has no lines available
             - week is the week of the projection found
         """
-        player_name_lower = player_name.lower()
+        name = _canonical_name(player_name)
+        memo_key = (name, position, scoring_format, self.next_week, self.current_week)
+        result = self._lookup_results.get(memo_key)
+        if result is None:
+            if len(self._lookup_results) >= self.MAX_LOOKUP_RESULTS:
+                self._lookup_results.clear()
+            result = self._find_projection(name, position, scoring_format)
+            self._lookup_results[memo_key] = result
+        return result
+
+    def _find_projection(self, name: str, position: str, scoring_format: str) -> tuple[float, bool, str]:
+        """Search the projection index for a player.
 
+        Args:
+            name: Player's canonical name
+            position: Player position (QB, RB, WR, TE)
+            scoring_format: Scoring format (PPR, HALF_PPR, STANDARD)
+
+        Returns:
+            Tuple of (projected points, has_projection, week)
+        """
         # Try next week first (most common case - looking ahead to upcoming games)
         # Then fall back to current week (for Thursday games during the week)
         weeks_to_check = [self.next_week, self.current_week]
 
         for week_to_check in weeks_to_check:
-            for proj in self.projections_cache.get('projections', []):
-                proj_name = proj.get('player', '').lower()  # Field is 'player', not 'player_name'
-                proj_position = proj.get('position', '')
-                proj_format = proj.get('format', '')
-                proj_week = proj.get('week', '')
-
-                # Must match position, format, week, and name
-                if (proj_position == position and
-                    proj_format == scoring_format and
-                    proj_week == week_to_check):
+            bucket = self._projection_index.get((week_to_check, position, scoring_format))
+            if not bucket:
+                continue
 
-                    # Check name matching
-                    if (proj_name == player_name_lower or
-                        player_name_lower in proj_name or
-                        proj_name in player_name_lower):
+            # Exact name match first, then partial matches for the rare names
+            # that normalization doesn't reconcile (e.g. nicknames)
+            proj = bucket.get(name)
+            if proj is None:
+                proj = next(
+                    (p for proj_name, p in bucket.items()
+                     if name in proj_name or proj_name in name),
+                    None
+                )
 
-                        total_points = proj.get('total_points', 0)
-                        return (total_points, True, proj_week)
+            if proj is not None:
+                return (proj.get('total_points', 0), True, week_to_check)
 
         # No projection found for this player in upcoming weeks
         return (0, False, '')
@@ -192,34 +242,36 @@ class StartSitOptimizer:
         if roster_config is None:
             roster_config = self.ROSTER_POSITIONS.copy()
 
-        # Get player projections
-        player_projections = []
+        # Gather roster metadata first
+        roster_meta = []
         for player_id in roster_players:
             if not player_id:
                 continue
 
             player_data = sleeper_players_db.get(player_id, {})
-            full_name = player_data.get('full_name', 'Unknown')
-            position = player_data.get('position', '')
-            injury_status = player_data.get('injury_status', '')
-
-            # Skip DEF and K for now (no projections)
-            if position in ['DEF', 'K']:
-                player_projections.append({
-                    'player_id': player_id,
-                    'name': full_name,
-                    'position': position,
-                    'projection': 0,
-                    'injury_status': injury_status,
-                    'has_projection': False,
-                    'no_lines': True,
-                    'week': ''
-                })
-                continue
-
-            projection, has_projection, week = self.get_player_projection(full_name, position, scoring_format)
+            roster_meta.append((
+                player_id,
+                player_data.get('full_name', 'Unknown'),
+                player_data.get('position', ''),
+                player_data.get('injury_status', '')
+            ))
+
+        # Then look up every projection in one sweep. DEF and K have no
+        # projections, so they are kept apart and skip the sort and FLEX fill.
+        get_projection = self.get_player_projection
+        player_projections = []
+        static_players = []
+        weeks_seen = set()
+        for player_id, full_name, position, injury_status in roster_meta:
+            if position in self.NON_PROJECTED_POSITIONS:
+                projection, has_projection, week = 0, False, ''
+                players = static_players
+            else:
+                projection, has_projection, week = get_projection(full_name, position, scoring_format)
+                players = player_projections
+                weeks_seen.add(week)
 
-            player_projections.append({
+            players.append({
                 'player_id': player_id,
                 'name': full_name,
                 'position': position,
@@ -230,10 +282,11 @@ class StartSitOptimizer:
                 'week': week
             })
 
-        # Sort by projection (highest first)
-        player_projections.sort(key=lambda x: x['projection'], reverse=True)
-
-        # Build optimal lineup
+        # Build optimal lineup. Filling each primary position with its top
+        # players and then FLEX with the best remaining RB/WR/TE is exact for
+        # this slot layout: any lineup that starts a lower-projected player at
+        # a primary slot can swap in the higher one without losing points, so
+        # no knapsack/DP search is needed.
         starters = {
             'QB': [],
             'RB': [],
@@ -243,30 +296,36 @@ class StartSitOptimizer:
             'K': [],
             'DEF': []
         }
-        bench = []
         used_players = set()
+        by_projection = itemgetter('projection')
+
+        # Group players by position in one pass (roster order)
+        players_by_position = defaultdict(list)
+        for player in player_projections:
+            players_by_position[player['position']].append(player)
+        for player in static_players:
+            players_by_position[player['position']].append(player)
 
         # Fill primary positions first
         for position in ['QB', 'RB', 'WR', 'TE', 'K', 'DEF']:
             max_starters = roster_config.get(position, 0)
-            position_players = [p for p in player_projections if p['position'] == position and p['player_id'] not in used_players]
-
-            for i, player in enumerate(position_players):
-                if i < max_starters:
-                    starters[position].append(player)
-                    used_players.add(player['player_id'])
+            starters[position] = heapq.nlargest(max_starters, players_by_position.get(position, []), key=by_projection)
+            used_players.update(p['player_id'] for p in starters[position])
 
         # Fill FLEX with best remaining RB/WR/TE
         flex_count = roster_config.get('FLEX', 0)
         flex_eligible = [p for p in player_projections if p['position'] in self.FLEX_POSITIONS and p['player_id'] not in used_players]
 
-        for i, player in enumerate(flex_eligible):
-            if i < flex_count:
-                starters['FLEX'].append(player)
-                used_players.add(player['player_id'])
+        starters['FLEX'] = heapq.nlargest(flex_count, flex_eligible, key=by_projection)
+        used_players.update(p['player_id'] for p in starters['FLEX'])
 
-        # Remaining players go to bench
-        bench = [p for p in player_projections if p['player_id'] not in used_players]
+        # Remaining players go to bench (highest projection first)
+        bench = sorted(
+            (p for p in player_projections if p['player_id'] not in used_players),
+            key=by_projection,
+            reverse=True
+        )
+        bench.extend(p for p in static_players if p['player_id'] not in used_players)
 
         # Calculate total projected points
         total_projection = sum(
@@ -277,18 +336,9 @@ class StartSitOptimizer:
         # Find start/sit recommendations
         recommendations = self._generate_recommendations(starters, bench)
 
-        # Determine which week we're showing (prefer next week)
-        projection_week = self.next_week
-        # Check if any projections are from current week
-        all_players = []
-        for pos_players in starters.values():
-            all_players.extend(pos_players)
-        all_players.extend(bench)
-
-        if all_players:
-            weeks_found = [p.get('week') for p in all_players if p.get('week')]
-            if weeks_found and self.current_week in weeks_found:
-                projection_week = self.current_week
+        # Determine which week we're showing (prefer next week unless any
+        # projections are from the current week)
+        projection_week = self.current_week if self.current_week in weeks_seen else self.next_week
 
         return {
             'starters': starters,
@@ -309,44 +359,39 @@ class StartSitOptimizer:
         Returns:
             List of recommended swaps
         """
-        recommendations = []
-
-        # Check each bench player against starters in their position
-        for bench_player in bench:
-            position = bench_player['position']
-            bench_proj = bench_player['projection']
-
-            # Check primary position
-            if position in starters and starters[position]:
-                for starter in starters[position]:
-                    if bench_proj > starter['projection']:
-                        gain = bench_proj - starter['projection']
-                        recommendations.append({
-                            'action': 'swap',
-                            'bench_player': bench_player['name'],
-                            'bench_projection': bench_proj,
-                            'starter_player': starter['name'],
-                            'starter_projection': starter['projection'],
-                            'position': position,
-                            'projected_gain': round(gain, 2)
-                        })
-
-            # Check FLEX if eligible
-            if position in self.FLEX_POSITIONS and 'FLEX' in starters and starters['FLEX']:
-                for flex_starter in starters['FLEX']:
-                    if bench_proj > flex_starter['projection']:
-                        gain = bench_proj - flex_starter['projection']
-                        recommendations.append({
-                            'action': 'swap',
-                            'bench_player': bench_player['name'],
-                            'bench_projection': bench_proj,
-                            'starter_player': flex_starter['name'],
-                            'starter_projection': flex_starter['projection'],
-                            'position': 'FLEX',
-                            'projected_gain': round(gain, 2)
-                        })
-
-        # Sort by projected gain
-        recommendations.sort(key=lambda x: x['projected_gain'], reverse=True)
-
-        return recommendations[:5]  # Return top 5 recommendations
+        # A bench player gains the most by replacing the weakest starter in a
+        # slot, so that is the only swap worth suggesting per slot
+        weakest_starters = {
+            slot: min(slot_starters, key=itemgetter('projection'))
+            for slot, slot_starters in starters.items()
+            if slot_starters
+        }
+
+        def improving_swaps():
+            """Yield (gain, bench player, starter, slot) for every improving swap."""
+            for bench_player in bench:
+                position = bench_player['position']
+                bench_proj = bench_player['projection']
+
+                # Check primary position, then FLEX if eligible
+                slots = (position, 'FLEX') if position in self.FLEX_POSITIONS else (position,)
+                for slot in slots:
+                    starter = weakest_starters.get(slot)
+                    if starter is not None and bench_proj > starter['projection']:
+                        yield (round(bench_proj - starter['projection'], 2), bench_player, starter, slot)
+
+        # Keep only the top 5 swaps by projected gain, then build their details
+        top_swaps = heapq.nlargest(5, improving_swaps(), key=itemgetter(0))
+
+        return [
+            {
+                'action': 'swap',
+                'bench_player': bench_player['name'],
+                'bench_projection': bench_player['projection'],
+                'starter_player': starter['name'],
+                'starter_projection': starter['projection'],
+                'position': slot,
+                'projected_gain': gain
+            }
+            for gain, bench_player, starter, slot in top_swaps
+        ]
@@ -1,5 +1,6 @@
 """Projections module for calculating fantasy points."""
 
-from .calculator import ProjectionCalculator
+from .calculator import ProjectionCalculator, get_calculator
+from .nfl_calendar import calculate_nfl_week
 
-__all__ = ['ProjectionCalculator']
+__all__ = ['ProjectionCalculator', 'get_calculator', 'calculate_nfl_week']
@@ -3,6 +3,7 @@ Fantasy Football Projection Calculator
 Converts Vegas props to fantasy point projections
 """
 
+from functools import lru_cache
 from typing import Dict, List
 from config.scoring_formats import get_scoring_format
 
@@ -41,6 +42,18 @@ class ProjectionCalculator:
         if not self.scoring_rules:
             raise ValueError(f"Unknown scoring format: {scoring_format}")
 
+        # Points per unit for each directly scored prop, resolved once per format
+        self._prop_points = {
+            prop_key: (category, self.scoring_rules[category][stat])
+            for prop_key, (category, stat) in self.PROP_MAPPINGS.items()
+            if stat in self.scoring_rules.get(category, {})
+        }
+
+        # Points used by the TD and fumble estimates in _estimate_additional_stats
+        self._rush_td_points = self.scoring_rules["rushing"]["touchdowns"]
+        self._rec_td_points = self.scoring_rules["receiving"]["touchdowns"]
+        self._fumble_points = self.scoring_rules["fumbles"]["lost"]
+
     def calculate_projection(self, player_props: Dict) -> Dict:
         """Calculate fantasy projection for a player.
 
@@ -75,27 +88,22 @@ class ProjectionCalculator:
         }
 
         # Process each prop
+        breakdown = projection["breakdown"]
         for prop_key, prop_value in props.items():
-            if prop_key not in self.PROP_MAPPINGS:
-                continue
-
-            category, stat = self.PROP_MAPPINGS[prop_key]
-
             # Handle special case for anytime TD (needs to be distributed)
-            if stat == "anytime_td":
+            if prop_key == "player_anytime_td":
                 td_points = self._calculate_anytime_td_value(prop_value, props)
-                projection["breakdown"]["rushing"] += td_points.get("rushing", 0)
-                projection["breakdown"]["receiving"] += td_points.get("receiving", 0)
+                breakdown["rushing"] += td_points.get("rushing", 0)
+                breakdown["receiving"] += td_points.get("receiving", 0)
                 continue
 
-            # Get scoring rules for this category
-            if category in self.scoring_rules:
-                category_rules = self.scoring_rules[category]
+            scoring = self._prop_points.get(prop_key)
+            if scoring is None:
+                continue
 
-                if stat in category_rules:
-                    points = prop_value * category_rules[stat]
-                    projection["breakdown"][category] += points
-                    projection["stats"][prop_key] = prop_value
+            category, points_per_unit = scoring
+            breakdown[category] += prop_value * points_per_unit
+            projection["stats"][prop_key] = prop_value
 
         # Estimate some stats if not directly provided
         projection = self._estimate_additional_stats(projection, props)
@@ -171,7 +179,7 @@ class ProjectionCalculator:
             rush_yds = props["player_rush_yds"]
             # Historically, roughly 1 TD per 80-100 rushing yards
             estimated_rush_tds = rush_yds / 90.0
-            rush_td_points = estimated_rush_tds * self.scoring_rules["rushing"]["touchdowns"]
+            rush_td_points = estimated_rush_tds * self._rush_td_points
             projection["breakdown"]["rushing"] += rush_td_points
             projection["stats"]["estimated_rush_tds"] = estimated_rush_tds
 
@@ -180,7 +188,7 @@ class ProjectionCalculator:
             rec_yds = props["player_reception_yds"]
             # Historically, roughly 1 TD per 100-120 receiving yards
             estimated_rec_tds = rec_yds / 110.0
-            rec_td_points = estimated_rec_tds * self.scoring_rules["receiving"]["touchdowns"]
+            rec_td_points = estimated_rec_tds * self._rec_td_points
             projection["breakdown"]["receiving"] += rec_td_points
             projection["stats"]["estimated_rec_tds"] = estimated_rec_tds
 
@@ -191,7 +199,7 @@ class ProjectionCalculator:
 
         if total_touches > 0:
             estimated_fumbles = total_touches / 200.0
-            fumble_points = estimated_fumbles * self.scoring_rules["fumbles"]["lost"]
+            fumble_points = estimated_fumbles * self._fumble_points
             projection["breakdown"]["fumbles"] += fumble_points
             projection["stats"]["estimated_fumbles"] = estimated_fumbles
 
@@ -210,10 +218,19 @@ class ProjectionCalculator:
         if formats is None:
             formats = ["PPR", "HALF_PPR", "STANDARD"]
 
-        projections = []
-        for format_name in formats:
-            calc = ProjectionCalculator(format_name)
-            projection = calc.calculate_projection(player_props)
-            projections.append(projection)
+        return [get_calculator(format_name).calculate_projection(player_props) for format_name in formats]
+
+
+@lru_cache(maxsize=8)
+def get_calculator(scoring_format: str = "PPR") -> ProjectionCalculator:
+    """Get the shared calculator for a scoring format.
+
+    Calculators hold no per-player state, so one instance per format is reused.
+
+    Args:
+        scoring_format: Scoring format name (PPR, HALF_PPR, or STANDARD)
 
-        return projections
+    Returns:
+        ProjectionCalculator for the format
+    """
+    return ProjectionCalculator(scoring_format)
@@ -0,0 +1,49 @@
+"""
+NFL Calendar Helpers
+Maps timestamps to 2025 regular-season weeks
+"""
+
+from datetime import datetime, timezone
+from functools import lru_cache
+
+# 2025 NFL Season: Week 1 starts Thursday, September 4, 2025 and every
+# week starts exactly 7 days after the previous one
+WEEK1_START_2025 = datetime(2025, 9, 4, tzinfo=timezone.utc)
+REGULAR_SEASON_WEEKS = 18
+
+
+def nfl_week_number(moment: datetime) -> int:
+    """Get the regular-season week a moment falls in.
+
+    Args:
+        moment: Timezone-aware datetime (naive values are treated as UTC)
+
+    Returns:
+        Week number, clamped to 1-18 (before Week 1 counts as Week 1)
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+
+    # Whole weeks since Week 1, clamped to the regular season
+    week = (moment - WEEK1_START_2025).days // 7 + 1
+    return min(max(week, 1), REGULAR_SEASON_WEEKS)
+
+
+@lru_cache(maxsize=256)
+def calculate_nfl_week(commence_time_str: str) -> str:
+    """Calculate NFL week from game start time using 2025 NFL schedule.
+
+    Args:
+        commence_time_str: ISO format timestamp
+
+    Returns:
+        Week string (e.g., "Week 10"), or "TBD" if the time is missing or invalid
+    """
+    if not commence_time_str:
+        return "TBD"
+
+    try:
+        game_time = datetime.fromisoformat(commence_time_str.replace('Z', '+00:00'))
+        return f"Week {nfl_week_number(game_time)}"
+    except Exception:
+        return "TBD"
@@ -4,63 +4,21 @@ Update Projections Script
 Run this manually to fetch fresh data from The Odds API and cache it
 """
 
-import json
+import os
+import traceback
 from datetime import datetime
+from itertools import chain
+from operator import itemgetter
+
+import orjson
+
 from src.api.odds_api import OddsAPIClient, parse_player_props, detect_position
-from src.projections.calculator import ProjectionCalculator
+from src.projections.calculator import get_calculator
+from src.projections.nfl_calendar import calculate_nfl_week
 from config.scoring_formats import get_available_formats
 
-
-def calculate_nfl_week(commence_time_str: str) -> str:
-    """Calculate NFL week from game start time using 2025 NFL schedule."""
-    if not commence_time_str:
-        return "TBD"
-
-    try:
-        game_time = datetime.fromisoformat(commence_time_str.replace('Z', '+00:00'))
-
-        # 2025 NFL Season Schedule (Thursday start dates for each week)
-        # Week 1 starts Thursday, September 4, 2025
-        week_start_dates_2025 = [
-            datetime(2025, 9, 4, tzinfo=game_time.tzinfo),   # Week 1
-            datetime(2025, 9, 11, tzinfo=game_time.tzinfo),  # Week 2
-            datetime(2025, 9, 18, tzinfo=game_time.tzinfo),  # Week 3
-            datetime(2025, 9, 25, tzinfo=game_time.tzinfo),  # Week 4
-            datetime(2025, 10, 2, tzinfo=game_time.tzinfo),  # Week 5
-            datetime(2025, 10, 9, tzinfo=game_time.tzinfo),  # Week 6
-            datetime(2025, 10, 16, tzinfo=game_time.tzinfo), # Week 7
-            datetime(2025, 10, 23, tzinfo=game_time.tzinfo), # Week 8
-            datetime(2025, 10, 30, tzinfo=game_time.tzinfo), # Week 9
-            datetime(2025, 11, 6, tzinfo=game_time.tzinfo),  # Week 10
-            datetime(2025, 11, 13, tzinfo=game_time.tzinfo), # Week 11
-            datetime(2025, 11, 20, tzinfo=game_time.tzinfo), # Week 12
-            datetime(2025, 11, 27, tzinfo=game_time.tzinfo), # Week 13
-            datetime(2025, 12, 4, tzinfo=game_time.tzinfo),  # Week 14
-            datetime(2025, 12, 11, tzinfo=game_time.tzinfo), # Week 15
-            datetime(2025, 12, 18, tzinfo=game_time.tzinfo), # Week 16
-            datetime(2025, 12, 25, tzinfo=game_time.tzinfo), # Week 17
-            datetime(2026, 1, 1, tzinfo=game_time.tzinfo),   # Week 18
-        ]
-
-        # Find which week the game falls into
-        for i, week_start in enumerate(week_start_dates_2025):
-            # Check if game is before the next week starts
-            if i < len(week_start_dates_2025) - 1:
-                next_week_start = week_start_dates_2025[i + 1]
-                if week_start <= game_time < next_week_start:
-                    return f"Week {i + 1}"
-            else:
-                # Last week (Week 18)
-                if game_time >= week_start:
-                    return f"Week {i + 1}"
-
-        # If before Week 1, return Week 1
-        if game_time < week_start_dates_2025[0]:
-            return "Week 1"
-
-        return "TBD"
-    except Exception:
-        return "TBD"
+# Scoring formats to cache projections for
+FORMATS = get_available_formats()
 
 
 def update_projections():
@@ -76,11 +34,9 @@ def update_projections():
         'player_reception_yds'
     ]
 
-    # Initialize API client
-    client = OddsAPIClient()
-
-    # Fetch player props
-    events = client.get_player_props(sport='americanfootball_nfl', markets=markets)
+    # Initialize API client and fetch player props
+    with OddsAPIClient() as client:
+        events = client.get_player_props(sport='americanfootball_nfl', markets=markets)
 
     if not events:
         print("❌ No events found from The Odds API")
@@ -88,11 +44,8 @@ def update_projections():
 
     print(f"✓ Found {len(events)} events")
 
-    # Parse player props from all events
-    all_players = {}
-    for event in events:
-        players = parse_player_props(event)
-        all_players.update(players)
+    # Parse player props from all events (later events win for duplicate names)
+    all_players = dict(chain.from_iterable(parse_player_props(event).items() for event in events))
 
     if not all_players:
         print("❌ No player props found in the events")
@@ -103,7 +56,7 @@ def update_projections():
     # Calculate projections for all formats
     print("📊 Calculating projections...")
     all_projections = []
-    formats = get_available_formats()
+    calculators = [get_calculator(format_name) for format_name in FORMATS]
 
     for player_name, player_data in all_players.items():
         # Detect position
@@ -119,8 +72,7 @@ def update_projections():
         matchup = f"{away_team} @ {home_team}" if home_team and away_team else "TBD"
         week = calculate_nfl_week(commence_time)
 
-        for format_name in formats:
-            calculator = ProjectionCalculator(format_name)
+        for calculator in calculators:
             projection = calculator.calculate_projection(player_data)
 
             # Add position and game info
@@ -132,21 +84,30 @@ def update_projections():
             all_projections.append(projection)
 
     # Sort by total points
-    all_projections.sort(key=lambda x: x['total_points'], reverse=True)
+    all_projections.sort(key=itemgetter('total_points'), reverse=True)
 
-    # Create cache data
+    # Create cache data (both timestamps describe the same moment)
+    updated_at = datetime.now()
     cache_data = {
         'projections': all_projections,
         'total_players': len(all_players),
-        'formats': formats,
-        'last_updated': datetime.now().isoformat(),
-        'last_updated_display': datetime.now().strftime('%B %d, %Y at %I:%M %p')
+        'formats': FORMATS,
+        'last_updated': updated_at.isoformat(),
+        'last_updated_display': updated_at.strftime('%B %d, %Y at %I:%M %p')
     }
 
-    # Save to cache file
+    # Save to cache file. Write a temp file and swap it in so the web app
+    # never reads a half-written cache.
     cache_file = 'data/projections_cache.json'
-    with open(cache_file, 'w') as f:
-        json.dump(cache_data, f, indent=2)
+    tmp_file = cache_file + '.tmp'
+    try:
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(cache_data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_file, cache_file)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
 
     print(f"✅ Successfully cached {len(all_projections)} projections")
     print(f"📁 Saved to: {cache_file}")
@@ -158,5 +119,4 @@ if __name__ == "__main__":
         update_projections()
     except Exception as e:
         print(f"❌ Error: {e}")
-        import traceback
         traceback.print_exc()